@@ -4,24 +4,49 @@ Sarasota County Arrest Scraper
 Scrapes arrest data from Sarasota Sheriff's Office and uploads to Google Sheets
 """
 import argparse
-import json
+import asyncio
+import os
 import re
 import sys
-import time
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import quote
 
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
+import httpx
+import lxml.html
+import msgspec
+import orjson
+from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-import pandas as pd
-import gspread
-
 # Configuration
 ENTRY_URL = "https://www.sarasotasheriff.org/arrest-reports/index.php"
 CREDENTIALS_FILE = 'credentials.json'
 GOOGLE_SHEET_ID = '14UfXJom1i9B9nfTiC0rzelDHM8mGJzw0pnoFxTyGpGo'
 WORKSHEET_NAME = 'Sarasota County'
+DEFAULT_CONCURRENCY = 4
+# Cookies/localStorage saved between runs so the site loads warm
+STORAGE_STATE_FILE = 'browser_state.json'
+
+# Anything that signals the search results have rendered
+RESULTS_SELECTOR = "table tbody tr, .result, .card"
+
+# Cheap fingerprint of the rendered results, used to tell when a page turn landed
+RESULTS_SIGNATURE_JS = """(sel) => {
+    const els = document.querySelectorAll(sel);
+    const text = (el) => (el ? el.innerText : '');
+    return els.length + '|' + text(els[0]) + '|' + text(els[els.length - 1]);
+}"""
+
+# Pager links stay "enabled" to Playwright, so also honour the ARIA and
+# class conventions (including a disabled <li> wrapper) that mark the last page
+NEXT_DISABLED_JS = """(el) => el.disabled || !!el.closest('[aria-disabled="true"], .disabled')"""
+
+# Resource types never needed for a text-only scrape
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# Headers from a sniffed request that must not be replayed verbatim
+REPLAY_SKIP_HEADERS = {"host", "content-length", "accept-encoding", "connection"}
 
 # Selector hints for Revize CMS
 SELECTOR_HINTS = {
@@ -54,9 +79,47 @@ SELECTOR_HINTS = {
     ],
 }
 
+# Hint lists joined into selector lists so one query covers every hint
+DATE_INPUT_SEL = ", ".join(SELECTOR_HINTS["date_inputs"])
+SEARCH_BUTTON_SEL = ", ".join(SELECTOR_HINTS["search_buttons"])
+NEXT_BUTTON_SEL = ", ".join(SELECTOR_HINTS["next_buttons"])
 
-@dataclass
-class ArrestRow:
+# URL fragments marking a JSON response as search data worth keeping
+_JSON_URL_KEYS = ("arrest", "inmate", "search", "booking")
+
+# Precompiled patterns for date normalization and card-layout parsing
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_US_DATE_RE = re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$")
+# Query/body parameters that make a sniffed request return only one page
+_PAGE_PARAM_RE = re.compile(
+    r'(?:^|[?&{,\s"])(?:page(?:num(?:ber)?|index|no|size)?|offset|skip|limit|take'
+    r'|start(?:row|index)?)"?\s*[=:]',
+    re.I,
+)
+
+# Every label a card may carry; free-text values stop where the next one begins
+_CARD_LABELS = (
+    r"(?:Name|Arrest\s*Date|DOB|Date of Birth|Age|Booking\s*(?:No\.|#|Number)"
+    r"|Arresting Agency|Agency|Bond|Charges|Charge):"
+)
+_UNTIL_NEXT_LABEL = rf"(?![ \t]*{_CARD_LABELS})[^\n]+?(?=\s+{_CARD_LABELS}|$)"
+
+# One alternation over every card label. Each branch has a single named
+# group matching an ArrestRow field, so m.lastgroup says which field matched.
+_CARD_RE = re.compile(
+    rf"Name:[ \t]*(?P<name>{_UNTIL_NEXT_LABEL})"
+    r"|Arrest\s*Date:[ \t]*(?P<arrest_date>[0-9/\-: ]+)"
+    r"|(?:DOB|Date of Birth):[ \t]*(?P<dob>[0-9/\-]+)"
+    r"|Age:[ \t]*(?P<age>\d{1,3})"
+    r"|Booking\s*(?:No\.|#|Number):[ \t]*(?P<booking_number>[A-Za-z0-9\-]+)"
+    rf"|(?:Arresting Agency|Agency):[ \t]*(?P<agency>{_UNTIL_NEXT_LABEL})"
+    rf"|Bond:[ \t]*(?P<bond>{_UNTIL_NEXT_LABEL})"
+    rf"|(?:Charges|Charge):[ \t]*(?P<charges>{_UNTIL_NEXT_LABEL})",
+    re.I | re.M,
+)
+
+
+class ArrestRow(msgspec.Struct):
     """Data structure for arrest records"""
     arrest_date: Optional[str] = None
     name: Optional[str] = None
@@ -73,84 +136,119 @@ class ArrestRow:
 def normalize_date(d: str) -> str:
     """Normalize date to YYYY-MM-DD format"""
     d = d.strip()
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", d):
+    if _ISO_DATE_RE.match(d):
         return d
-    if re.match(r"^\d{1,2}/\d{1,2}/\d{4}$", d):
+    if _US_DATE_RE.match(d):
         return datetime.strptime(d, "%m/%d/%Y").strftime("%Y-%m-%d")
     raise ValueError(f"Unrecognized date format: {d}")
 
 
-def daterange(start: str, end: str):
+def daterange(start: str, end: str) -> List[str]:
     """Generate date range"""
-    s = datetime.strptime(normalize_date(start), "%Y-%m-%d")
-    e = datetime.strptime(normalize_date(end), "%Y-%m-%d")
-    step = timedelta(days=1)
-    while s <= e:
-        yield s.strftime("%Y-%m-%d")
-        s += step
+    s = date.fromisoformat(normalize_date(start))
+    e = date.fromisoformat(normalize_date(end))
+    return [(s + timedelta(days=n)).isoformat() for n in range((e - s).days + 1)]
 
 
-def try_fill_date(page, date_val: str) -> bool:
+async def try_fill_date(page, date_val: str) -> bool:
     """Try to fill date input fields"""
-    for sel in SELECTOR_HINTS["date_inputs"]:
-        matches = page.locator(sel)
-        if matches.count() > 0:
-            try:
-                # Use JavaScript to set value and trigger events
-                page.evaluate("""(s, v) => {
-                    const el = document.querySelector(s);
-                    if (!el) return;
-                    el.value = v;
-                    el.dispatchEvent(new Event('input', {bubbles:true}));
-                    el.dispatchEvent(new Event('change', {bubbles:true}));
-                }""", sel, date_val)
-                
-                # Also try mm/dd/yyyy format
-                mmddyyyy = datetime.strptime(date_val, "%Y-%m-%d").strftime("%m/%d/%Y")
-                page.evaluate("""(s, v) => {
-                    const el = document.querySelector(s);
-                    if (!el) return;
-                    if (!el.value) {
-                        el.value = v;
-                        el.dispatchEvent(new Event('input', {bubbles:true}));
-                        el.dispatchEvent(new Event('change', {bubbles:true}));
-                    }
-                }""", sel, mmddyyyy)
-                return True
-            except Exception:
-                continue
-    return False
+    if await page.locator(DATE_INPUT_SEL).count() == 0:
+        return False
+    try:
+        # Use JavaScript to set the ISO value and trigger events, falling
+        # back to mm/dd/yyyy if the input rejected it. Any pre-filled default
+        # is overwritten; false means nothing stuck and .fill() should be tried.
+        mmddyyyy = datetime.strptime(date_val, "%Y-%m-%d").strftime("%m/%d/%Y")
+        return bool(await page.evaluate("""([s, iso, us]) => {
+            const el = document.querySelector(s);
+            if (!el) return false;
+            const set = (v) => {
+                el.value = v;
+                el.dispatchEvent(new Event('input', {bubbles:true}));
+                el.dispatchEvent(new Event('change', {bubbles:true}));
+            };
+            set(iso);
+            if (!el.value) set(us);
+            return !!el.value;
+        }""", [DATE_INPUT_SEL, date_val, mmddyyyy]))
+    except Exception:
+        return False
 
 
-def click_search(page) -> bool:
+async def click_search(page) -> bool:
     """Try to click search/submit button"""
-    for btn in SELECTOR_HINTS["search_buttons"]:
-        loc = page.locator(btn)
-        if loc.count() > 0:
-            try:
-                loc.first.click(timeout=3000)
-                return True
-            except Exception:
-                continue
+    # One query rules out pages with no button at all; otherwise walk the
+    # hints in priority order so a failed click falls through to the next
+    if await page.locator(SEARCH_BUTTON_SEL).count() > 0:
+        for btn in SELECTOR_HINTS["search_buttons"]:
+            loc = page.locator(btn)
+            if await loc.count() > 0:
+                try:
+                    await loc.first.click(timeout=3000)
+                    return True
+                except Exception:
+                    continue
     
     # Fallback: press Enter on date field
     try:
-        for sel in SELECTOR_HINTS["date_inputs"]:
-            if page.locator(sel).count() > 0:
-                page.locator(sel).first.press("Enter")
-                return True
+        date_loc = page.locator(DATE_INPUT_SEL)
+        if await date_loc.count() > 0:
+            await date_loc.first.press("Enter")
+            return True
     except Exception:
         pass
     return False
 
 
-def extract_rows_from_table(table_el) -> List[ArrestRow]:
-    """Extract arrest data from HTML table"""
-    headers = [h.inner_text().strip().lower() for h in table_el.locator("thead th, thead td").all()]
+# Find the first result container and read it out in a single round-trip.
+# Mirrors the hint order: tables need body rows, other containers need items.
+# Tables come back as raw HTML and are parsed with lxml on the Python side.
+FIND_RESULTS_JS = """(hints) => {
+    const readTable = (t) => ({kind: 'table', html: t.outerHTML});
+    for (const sel of hints) {
+        let els;
+        try { els = document.querySelectorAll(sel); } catch (e) { continue; }
+        for (const el of els) {
+            if (el.tagName.toLowerCase() === 'table') {
+                if (el.querySelector('tbody tr')) return readTable(el);
+            } else {
+                const items = el.querySelectorAll('.card, .result, .list-item, li, .row');
+                if (items.length) {
+                    return {kind: 'cards', texts: Array.from(items).map(it => it.innerText)};
+                }
+            }
+        }
+    }
+    // Last resort: any table on the page
+    const first = document.querySelector('table');
+    return first ? readTable(first) : null;
+}"""
+
+
+def _visible_text(el) -> str:
+    """Approximate innerText for a parsed cell: line breaks kept, whitespace collapsed"""
+    lines = el.text_content().splitlines()
+    return "\n".join(" ".join(l.split()) for l in lines if l.strip())
+
+
+def rows_from_table(html: str) -> List[ArrestRow]:
+    """Extract arrest data from HTML table markup"""
+    tree = lxml.html.fromstring(html)
+    # innerText skips scripts, styles and hidden nodes and breaks lines at
+    # <br> and block elements; make text_content() behave the same way
+    for el in tree.xpath(
+        ".//script|.//style|.//*[@hidden]"
+        "|.//*[contains(translate(@style, ' ', ''), 'display:none')]"
+    ):
+        el.drop_tree()
+    for el in tree.xpath(".//br|.//p|.//div|.//li"):
+        el.tail = "\n" + (el.tail or "")
+    
+    headers = [_visible_text(h).lower() for h in tree.xpath(".//thead//th|.//thead//td")]
     rows = []
     
-    for tr in table_el.locator("tbody tr").all():
-        cells = [c.inner_text().strip() for c in tr.locator("td,th").all()]
+    for tr in tree.xpath(".//tbody/tr"):
+        cells = [_visible_text(c) for c in tr.xpath("./td|./th")]
         data = dict(zip(headers, cells))
         rows.append(
             ArrestRow(
@@ -167,227 +265,378 @@ def extract_rows_from_table(table_el) -> List[ArrestRow]:
     return rows
 
 
-def extract_rows_from_cards(container) -> List[ArrestRow]:
-    """Extract arrest data from card/list layout"""
-    items = container.locator(".card, .result, .list-item, li, .row")
+def rows_from_cards(texts: List[str]) -> List[ArrestRow]:
+    """Map card/list item text to arrest rows"""
     rows = []
     
-    for it in items.all():
-        text = it.inner_text()
-        
-        # Extract fields using regex patterns
-        name = re.search(r"Name:\s*(.+)", text, re.I)
-        arrest_date = re.search(r"Arrest\s*Date:\s*([0-9/\-: ]+)", text, re.I)
-        dob = re.search(r"(DOB|Date of Birth):\s*([0-9/\-]+)", text, re.I)
-        age = re.search(r"Age:\s*(\d{1,3})", text, re.I)
-        booking = re.search(r"(Booking\s*(No\.|#|Number)):\s*([A-Za-z0-9\-]+)", text, re.I)
-        agency = re.search(r"(Agency|Arresting Agency):\s*(.+)", text, re.I)
-        bond = re.search(r"Bond:\s*([^\n]+)", text, re.I)
-        
-        charges = None
-        ch = re.search(r"(Charge|Charges):\s*(.+)", text, re.I)
-        if ch:
-            charges = ch.group(2).strip()
-        
-        rows.append(
-            ArrestRow(
-                arrest_date=arrest_date.group(1).strip() if arrest_date else None,
-                name=name.group(1).strip() if name else None,
-                dob=dob.group(2).strip() if dob else None,
-                age=age.group(1).strip() if age else None,
-                charges=charges,
-                agency=agency.group(2).strip() if agency else None,
-                booking_number=(booking.group(3).strip() if booking else None),
-                bond=bond.group(1).strip() if bond else None,
-            )
-        )
+    for text in texts:
+        # Single scan over the text; keep the first hit for each field
+        found = {}
+        for m in _CARD_RE.finditer(text):
+            found.setdefault(m.lastgroup, m.group(m.lastgroup).strip())
+        rows.append(ArrestRow(**found))
     return rows
 
 
-def try_extract_rows(page) -> List[ArrestRow]:
+async def try_extract_rows(page) -> List[ArrestRow]:
     """Try to extract arrest rows from page"""
-    # Try table first
-    for sel in SELECTOR_HINTS["result_containers"]:
-        loc = page.locator(sel)
-        if loc.count() == 0:
-            continue
-        
-        for el in loc.all():
-            try:
-                if el.evaluate("e => e.tagName && e.tagName.toLowerCase() === 'table'"):
-                    if el.locator("tbody tr").count() > 0:
-                        return extract_rows_from_table(el)
-                else:
-                    # Try card parsing
-                    rows = extract_rows_from_cards(el)
-                    if rows:
-                        return rows
-            except Exception:
-                continue
-    
-    # Last resort: parse any table on page
-    if page.locator("table").count() > 0:
-        return extract_rows_from_table(page.locator("table").first)
-    
-    return []
+    found = await page.evaluate(FIND_RESULTS_JS, SELECTOR_HINTS["result_containers"])
+    if not found:
+        return []
+    if found["kind"] == "table":
+        return rows_from_table(found["html"])
+    return rows_from_cards(found["texts"])
+
+
+async def wait_for_results_change(page, before: str, timeout: int) -> bool:
+    """Wait until the results signature differs from `before`; False on timeout"""
+    try:
+        await page.wait_for_function(
+            f"([sel, before]) => ({RESULTS_SIGNATURE_JS})(sel) !== before",
+            arg=[RESULTS_SELECTOR, before],
+            timeout=timeout,
+        )
+        return True
+    except PWTimeoutError:
+        return False
 
 
-def paginate(page):
+async def paginate(page):
     """Click through pagination"""
+    # One selector list covers every pager hint; the locator re-resolves lazily
+    next_loc = page.locator(NEXT_BUTTON_SEL).first
+    if await next_loc.count() == 0:
+        return
+    
     while True:
-        clicked = False
-        for sel in SELECTOR_HINTS["next_buttons"]:
-            btn = page.locator(sel)
-            if btn.count() > 0 and btn.first.is_enabled():
-                try:
-                    btn.first.click(timeout=2000)
-                    page.wait_for_timeout(800)
-                    clicked = True
-                    break
-                except Exception:
-                    continue
-        if not clicked:
+        try:
+            if not await next_loc.is_enabled(timeout=2000):
+                break
+            if await next_loc.evaluate(NEXT_DISABLED_JS):
+                break
+            before = await page.evaluate(RESULTS_SIGNATURE_JS, RESULTS_SELECTOR)
+            await next_loc.click(timeout=2000)
+        except Exception:
+            # Button disappeared or became unclickable - last page reached
+            break
+        # AJAX pagination and "Load More" never navigate, so wait for the
+        # result rows themselves to change rather than for a load state
+        if not await wait_for_results_change(page, before, 3000):
+            # Click had no visible effect - treat it as the last page
             break
 
 
-def maybe_pick_quick_link(page):
+async def maybe_pick_quick_link(page):
     """Try to click quick link to arrests page"""
     for txt in ["Arrests & Inmates", "Arrests & Inmates Search", "Arrest Inquiry"]:
         link = page.locator(f'a:has-text("{txt}")')
-        if link.count() > 0:
+        if await link.count() > 0:
             try:
-                link.first.click(timeout=2500)
-                page.wait_for_load_state("networkidle")
+                await link.first.click(timeout=2500)
+                await page.wait_for_load_state("networkidle")
                 return True
             except Exception:
                 pass
     return False
 
 
-@retry(
-    reraise=True,
-    stop=stop_after_attempt(2),
-    wait=wait_exponential(multiplier=1, min=1, max=6),
-    retry=retry_if_exception_type(PWTimeoutError),
-)
-def scrape_for_date(date_str: str, headless: bool = True) -> List[Dict]:
-    """Scrape arrests for a specific date"""
-    print(f"🔍 Scraping arrests for {date_str}...")
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=headless,
-            args=["--disable-blink-features=AutomationControlled"]
+def load_storage_state() -> Optional[Dict]:
+    """Browser state saved by the last run, or None if missing or unreadable"""
+    try:
+        with open(STORAGE_STATE_FILE, 'rb') as f:
+            state = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        state = None
+    if isinstance(state, dict) and isinstance(state.get("cookies"), list) \
+            and isinstance(state.get("origins"), list):
+        return state
+    # A corrupt file would break every context; drop it and start cold
+    print(f"⚠️ Ignoring unreadable {STORAGE_STATE_FILE}", file=sys.stderr)
+    try:
+        os.remove(STORAGE_STATE_FILE)
+    except OSError:
+        pass
+    return None
+
+
+def save_storage_state(state: Dict):
+    """Atomically replace the saved browser state"""
+    tmp = STORAGE_STATE_FILE + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(orjson.dumps(state))
+    os.replace(tmp, STORAGE_STATE_FILE)
+
+
+async def block_heavy_resources(route):
+    """Abort requests for assets the scraper never reads"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _date_variants(date_val: str) -> Tuple[str, str, str]:
+    """Ways a YYYY-MM-DD date can appear in a search request"""
+    mmddyyyy = datetime.strptime(date_val, "%Y-%m-%d").strftime("%m/%d/%Y")
+    return (date_val, mmddyyyy, quote(mmddyyyy, safe=""))
+
+
+@dataclass
+class JsonEndpoint:
+    """JSON search request sniffed from the page, replayable for other dates"""
+    method: str
+    url: str
+    headers: Dict[str, str]
+    post_data: Optional[str]
+    date_val: str
+
+    @classmethod
+    def from_payload(cls, payload: Dict, date_val: str) -> Optional["JsonEndpoint"]:
+        """Build an endpoint if the captured request is parameterised by date"""
+        carries_date = any(
+            v in payload["url"] or v in (payload["post_data"] or "")
+            for v in _date_variants(date_val)
         )
-        context = browser.new_context()
-        page = context.new_page()
+        if not carries_date:
+            return None
+        # Replaying a paged request would silently drop every later page
+        if _PAGE_PARAM_RE.search(payload["url"]) or _PAGE_PARAM_RE.search(payload["post_data"] or ""):
+            return None
+        headers = {
+            k: v for k, v in payload["headers"].items()
+            if not k.startswith(":") and k.lower() not in REPLAY_SKIP_HEADERS
+        }
+        return cls(payload["method"], payload["url"], headers, payload["post_data"], date_val)
+
+    def for_date(self, date_val: str) -> Tuple[str, Optional[str]]:
+        """URL and body of this request rewritten for another date"""
+        url, body = self.url, self.post_data
+        for old, new in zip(_date_variants(self.date_val), _date_variants(date_val)):
+            url = url.replace(old, new)
+            if body:
+                body = body.replace(old, new)
+        return url, body
+
+
+def rows_from_json(payload) -> Optional[List[ArrestRow]]:
+    """Map a JSON search payload to rows; None if the shape is unrecognized"""
+    if isinstance(payload, dict) and "results" in payload:
+        items = payload["results"]
+    elif isinstance(payload, list):
+        items = payload
+    else:
+        return None
+    # e.g. a search-suggest endpoint returning a list of strings
+    if not isinstance(items, list) or not all(isinstance(it, dict) for it in items):
+        return None
+    
+    def norm(v):
+        if v is None:
+            return None
+        return str(v).strip()
+    
+    rows = []
+    for it in items:
+        rows.append(ArrestRow(
+            arrest_date=norm(it.get("arrest_date") or it.get("arrestDate") or it.get("date")),
+            name=norm(it.get("name") or f"{it.get('last_name','')} {it.get('first_name','')}".strip()),
+            dob=norm(it.get("dob") or it.get("date_of_birth")),
+            age=norm(it.get("age")),
+            charges=norm(it.get("charges") or it.get("charge_summary") or it.get("charge")),
+            agency=norm(it.get("agency") or it.get("arresting_agency")),
+            booking_number=norm(it.get("booking_number") or it.get("bookingNo") or it.get("booking")),
+            bond=norm(it.get("bond")),
+        ))
+    return rows
+
+
+def dedupe_rows(rows: List[ArrestRow]) -> List[Dict]:
+    """Drop repeated arrests and convert to plain dicts"""
+    seen = set()
+    out = []
+    for r in rows:
+        key = (r.name, r.arrest_date, r.booking_number, r.charges)
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(msgspec.to_builtins(r))
+    return out
+
+
+async def fetch_from_api(client, endpoint: JsonEndpoint, date_val: str) -> Optional[List[ArrestRow]]:
+    """Replay the sniffed JSON search for a date; None means use the browser"""
+    url, body = endpoint.for_date(date_val)
+    try:
+        resp = await client.request(endpoint.method, url, headers=endpoint.headers, content=body)
+        resp.raise_for_status()
+        return rows_from_json(orjson.loads(resp.content))
+    except (httpx.HTTPError, ValueError) as e:
+        print(f"⚠️ [{date_val}] JSON endpoint failed ({e}), falling back to browser")
+        return None
+
+
+async def scrape_with_browser(browser, date_val: str, endpoints: List[JsonEndpoint],
+                              saved_state: Optional[Dict], new_states: List[Dict]) -> List[ArrestRow]:
+    """Drive the search form for a date in its own browser context"""
+    # Fresh context per date, seeded from the state saved by the previous run,
+    # so cookies set while scraping one date never leak into another
+    context = await browser.new_context(storage_state=saved_state)
+    await context.route("**/*", block_heavy_resources)
+    try:
+        page = await context.new_page()
         
         # Navigate to entry page with longer timeout
-        page.goto(ENTRY_URL, wait_until="domcontentloaded", timeout=60000)
+        await page.goto(ENTRY_URL, wait_until="domcontentloaded", timeout=60000)
         try:
-            page.wait_for_load_state("networkidle", timeout=45000)
+            await page.wait_for_load_state("networkidle", timeout=45000)
         except:
             # If networkidle times out, just wait a bit and continue
-            page.wait_for_timeout(3000)
-        maybe_pick_quick_link(page)
+            await page.wait_for_timeout(3000)
+        await maybe_pick_quick_link(page)
         
-        # Capture JSON responses
+        # Capture JSON responses along with the request that produced them
         json_payloads = []
-        def handle_response(resp):
+        async def handle_response(resp):
             try:
+                # Cheap URL check first so unrelated responses are never decoded
+                url = resp.url
+                url_lower = url.lower()
+                if not any(k in url_lower for k in _JSON_URL_KEYS):
+                    return
                 ctype = resp.headers.get("content-type", "")
                 if "application/json" in ctype.lower():
-                    url = resp.url
-                    if re.search(r"arrest|inmate|search|booking", url, re.I):
-                        data = resp.json()
-                        json_payloads.append({"url": url, "data": data})
+                    data = orjson.loads(await resp.body())
+                    req = resp.request
+                    json_payloads.append({
+                        "url": url,
+                        "data": data,
+                        "method": req.method,
+                        "headers": await req.all_headers(),
+                        "post_data": req.post_data,
+                    })
             except Exception:
                 pass
         
         context.on("response", handle_response)
         
         # Fill date
-        date_val = normalize_date(date_str)
-        ok = try_fill_date(page, date_val)
+        ok = await try_fill_date(page, date_val)
         
         if not ok:
             # Try filling first two date inputs (from/to)
-            inputs = []
-            for sel in SELECTOR_HINTS["date_inputs"]:
-                for el in page.locator(sel).all():
-                    inputs.append(el)
+            inputs = await page.locator(DATE_INPUT_SEL).all()
             if inputs:
                 try:
-                    inputs[0].fill(date_val)
+                    await inputs[0].fill(date_val)
                     if len(inputs) > 1:
-                        inputs[1].fill(date_val)
+                        await inputs[1].fill(date_val)
                     ok = True
                 except Exception:
                     pass
         
-        # Click search
-        clicked = click_search(page)
-        if not clicked:
-            page.wait_for_timeout(1000)
-        
-        # Wait for results and paginate
-        page.wait_for_timeout(1500)
-        paginate(page)
-        rows = try_extract_rows(page)
-        
-        # Try JSON fallback if DOM parsing failed
-        if not rows and json_payloads:
-            payload = json_payloads[-1]["data"]
-            flat = []
-            
-            def norm(v):
-                if v is None:
-                    return None
-                return str(v).strip()
-            
-            if isinstance(payload, dict) and "results" in payload:
-                items = payload["results"]
-            elif isinstance(payload, list):
-                items = payload
-            else:
-                items = []
-            
-            for it in items:
-                flat.append(ArrestRow(
-                    arrest_date=norm(it.get("arrest_date") or it.get("arrestDate") or it.get("date")),
-                    name=norm(it.get("name") or f"{it.get('last_name','')} {it.get('first_name','')}".strip()),
-                    dob=norm(it.get("dob") or it.get("date_of_birth")),
-                    age=norm(it.get("age")),
-                    charges=norm(it.get("charges") or it.get("charge_summary") or it.get("charge")),
-                    agency=norm(it.get("agency") or it.get("arresting_agency")),
-                    booking_number=norm(it.get("booking_number") or it.get("bookingNo") or it.get("booking")),
-                    bond=norm(it.get("bond")),
-                ))
-            rows = flat
-        
-        context.close()
-        browser.close()
+        # Click search, then wait for the results to change from whatever was
+        # rendered before (possibly a default listing). A date with no
+        # arrests may never change them, so a timeout here is fine.
+        before = await page.evaluate(RESULTS_SIGNATURE_JS, RESULTS_SELECTOR)
+        await click_search(page)
+        await wait_for_results_change(page, before, 10000)
+        await paginate(page)
+        rows = await try_extract_rows(page)
+        new_states.append(await context.storage_state())
+    finally:
+        await context.close()
+    
+    # Remember a date-driven JSON endpoint so later dates can skip the browser
+    if not endpoints:
+        # The first date-carrying request is the search itself, not a later page
+        for payload in json_payloads:
+            endpoint = JsonEndpoint.from_payload(payload, date_val)
+            if endpoint and rows_from_json(payload["data"]) is not None:
+                endpoints.append(endpoint)
+                print(f"⚡ Found JSON search endpoint: {endpoint.url}")
+                break
+    
+    # Try JSON fallback if DOM parsing failed
+    if not rows and json_payloads:
+        rows = rows_from_json(json_payloads[-1]["data"]) or []
+    
+    return rows
+
+
+@retry(
+    reraise=True,
+    stop=stop_after_attempt(2),
+    wait=wait_exponential(multiplier=1, min=1, max=6),
+    retry=retry_if_exception_type(PWTimeoutError),
+)
+async def scrape_for_date(browser, client, date_str: str, sem: asyncio.Semaphore,
+                          endpoints: List[JsonEndpoint], saved_state: Optional[Dict],
+                          new_states: List[Dict]) -> List[Dict]:
+    """Scrape arrests for a specific date, via the JSON endpoint when known"""
+    async with sem:
+        print(f"🔍 Scraping arrests for {date_str}...")
+        date_val = normalize_date(date_str)
         
-        # Deduplicate
-        seen = set()
-        out = []
-        for r in rows:
-            key = (r.name, r.arrest_date, r.booking_number, r.charges)
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(asdict(r))
+        rows = None
+        if endpoints:
+            rows = await fetch_from_api(client, endpoints[0], date_val)
+        if rows is None:
+            rows = await scrape_with_browser(browser, date_val, endpoints, saved_state, new_states)
         
+        out = dedupe_rows(rows)
         print(f"✅ Found {len(out)} arrest records for {date_str}")
         return out
 
 
+async def scrape_dates(dates: List[str], headless: bool = True,
+                       concurrency: int = DEFAULT_CONCURRENCY) -> List[Dict]:
+    """Scrape several dates concurrently in one shared browser"""
+    sem = asyncio.Semaphore(max(1, concurrency))
+    all_records = []
+    
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=headless,
+            args=["--disable-blink-features=AutomationControlled"]
+        )
+        # Filled by the first browser scrape that sniffs a JSON search request
+        endpoints: List[JsonEndpoint] = []
+        # Read once up front and written once at the end, never while
+        # several contexts are in flight
+        saved_state = load_storage_state()
+        new_states: List[Dict] = []
+        try:
+            async with httpx.AsyncClient(timeout=30) as client:
+                tasks = [
+                    scrape_for_date(browser, client, d, sem, endpoints, saved_state, new_states)
+                    for d in dates
+                ]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await browser.close()
+        if new_states:
+            save_storage_state(new_states[-1])
+    
+    # Results come back in date order regardless of completion order
+    for d, res in zip(dates, results):
+        if isinstance(res, Exception):
+            print(f"❌ [{d}] ERROR: {res}", file=sys.stderr)
+            continue
+        all_records.extend(res)
+    return all_records
+
+
 def upload_to_google_sheets(records: List[Dict]):
     """Upload records to Google Sheets"""
     if not records:
         print("⚠️ No records to upload")
         return
     
+    # Deferred so --no-upload runs never pay for the gspread import
+    import gspread
+    
     try:
         print("📤 Uploading to Google Sheets...")
         
@@ -401,19 +650,16 @@ def upload_to_google_sheets(records: List[Dict]):
         except:
             wks = spreadsheet.add_worksheet(title=WORKSHEET_NAME, rows=1000, cols=20)
         
-        # Convert to DataFrame
-        df = pd.DataFrame(records)
-        
         # Reorder columns for readability
         col_order = ['arrest_date', 'name', 'dob', 'age', 'booking_number', 
                      'agency', 'bond', 'arrest_time', 'charges', 'source_url']
-        cols = [c for c in col_order if c in df.columns]
-        df = df[cols]
+        cols = [c for c in col_order if c in records[0]]
         
         # Prepare data with headers
-        data_to_upload = [df.columns.tolist()] + df.values.tolist()
+        data_to_upload = [cols] + [[r.get(c) or "" for c in cols] for r in records]
         
-        # Clear and update
+        # Clear and update. Two small requests beat folding the clear into the
+        # update, which would mean sending a blank for every cell of the grid.
         wks.clear()
         wks.update('A1', data_to_upload, value_input_option='USER_ENTERED')
         
@@ -433,28 +679,24 @@ def main():
     ap.add_argument("--headful", action="store_true", help="Run with visible browser")
     ap.add_argument("--no-upload", action="store_true", help="Skip Google Sheets upload")
     ap.add_argument("--output", help="Save to JSON file")
+    ap.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                    help=f"Max dates scraped in parallel (default {DEFAULT_CONCURRENCY})")
     args = ap.parse_args()
     
     if not args.date and not (args.start and args.end):
         ap.error("Provide --date or both --start and --end")
     
-    dates = [args.date] if args.date else list(daterange(args.start, args.end))
-    all_records = []
-    
-    for d in dates:
-        try:
-            recs = scrape_for_date(d, headless=not args.headful)
-            all_records.extend(recs)
-            time.sleep(0.5)
-        except Exception as e:
-            print(f"❌ [{d}] ERROR: {e}", file=sys.stderr)
+    dates = [args.date] if args.date else daterange(args.start, args.end)
+    all_records = asyncio.run(
+        scrape_dates(dates, headless=not args.headful, concurrency=args.concurrency)
+    )
     
     print(f"\n📊 Total records scraped: {len(all_records)}")
     
     # Save to file if requested
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(all_records, f, ensure_ascii=False, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(msgspec.json.format(msgspec.json.encode(all_records), indent=2))
         print(f"💾 Saved to {args.output}")
     
     # Upload to Google Sheets
@@ -5,11 +5,10 @@ Handles iframe-based search interface
 """
 import argparse
 import json
+import os
 import sys
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-import pandas as pd
-import gspread
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -17,6 +16,11 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 ENTRY_URL = "https://www.sarasotasheriff.org/arrest-reports/index.php"
 GOOGLE_SHEET_ID = "14UfXJom1i9B9nfTiC0rzelDHM8mGJzw0pnoFxTyGpGo"
 WORKSHEET_NAME = "Sarasota County"
+# Cookies/localStorage saved between runs so the site loads warm
+STORAGE_STATE_FILE = "browser_state.json"
+
+# Resource types never needed for a text-only scrape
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
 
 def print_status(message: str, emoji: str = "🔍"):
     """Print formatted status message"""
@@ -30,18 +34,167 @@ def print_success(message: str):
     """Print formatted success message"""
     print(f"✅ {message}")
 
+def block_heavy_resources(route):
+    """Abort requests for assets the scraper never reads"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
 @retry(
     reraise=True,
     stop=stop_after_attempt(2),
     wait=wait_exponential(multiplier=1, min=1, max=6),
     retry=retry_if_exception_type(PWTimeoutError),
 )
-def scrape_for_date(date_str: str, headless: bool = True) -> List[Dict]:
+def scrape_for_date(context, date_str: str) -> List[Dict]:
     """
-    Scrape arrests for a specific date using iframe-based interface
+    Scrape arrests for a specific date using iframe-based interface.
+    Only opens a page in the shared browser context; the caller owns the browser.
     """
     print_status(f"Scraping arrests for {date_str}...")
     
+    page = context.new_page()
+    try:
+        # Navigate to main page
+        print_status("Loading main page...")
+        page.goto(ENTRY_URL, wait_until="domcontentloaded", timeout=60000)
+        
+        # Wait for iframe to appear
+        print_status("Waiting for search iframe...")
+        page.wait_for_selector('iframe', timeout=30000)
+        
+        # Get all iframes
+        iframes = page.frames
+        print_status(f"Found {len(iframes)} frames on page")
+        
+        # Find the iframe with the search interface
+        search_frame = None
+        for frame in iframes:
+            try:
+                # Check if this frame has the search interface
+                if frame.locator('input[placeholder*="date"]').count() > 0:
+                    search_frame = frame
+                    print_success("Found search interface iframe!")
+                    break
+            except:
+                continue
+        
+        if not search_frame:
+            # Try alternate approach - look for iframe by src
+            print_status("Trying alternate iframe detection...")
+            iframe_element = page.query_selector('iframe')
+            if iframe_element:
+                src = iframe_element.get_attribute('src')
+                print_status(f"Iframe src: {src}")
+                # Wait for iframe content to load
+                search_frame = iframe_element.content_frame()
+                if search_frame:
+                    search_frame.wait_for_load_state("domcontentloaded")
+        
+        if not search_frame:
+            raise Exception("Could not find search interface iframe")
+        
+        # Now work within the iframe
+        print_status("Interacting with search form...")
+        
+        # Convert date format from YYYY-MM-DD to MM/DD/YYYY
+        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+        formatted_date = date_obj.strftime("%m/%d/%Y")
+        
+        # Find and fill the date input
+        date_input = search_frame.locator('input[type="date"], input[placeholder*="date"]').first
+        date_input.fill(formatted_date)
+        print_status(f"Entered date: {formatted_date}")
+        
+        # Click search button
+        search_button = search_frame.locator('button:has-text("SEARCH"), input[type="submit"]').first
+        search_button.click()
+        print_status("Clicked search button")
+        
+        # Wait for results to load
+        print_status("Waiting for results...")
+        try:
+            search_frame.wait_for_selector('table tr', state="attached", timeout=15000)
+        except PWTimeoutError:
+            # No table rows - fall through to the text extraction below
+            pass
+        
+        # Try to extract results from the iframe
+        results = []
+        
+        # Look for table rows
+        rows = search_frame.locator('table tr, .result-row, .inmate-row').all()
+        print_status(f"Found {len(rows)} potential result rows")
+        
+        for row in rows:
+            try:
+                text = row.inner_text()
+                if text and len(text) > 10:  # Skip empty or header rows
+                    # Extract data - this will need to be adjusted based on actual structure
+                    results.append({
+                        "arrest_date": date_str,
+                        "raw_text": text,
+                        "scraped_at": datetime.now().isoformat()
+                    })
+            except:
+                continue
+        
+        # If no structured results, try to get all text content
+        if not results:
+            print_status("No structured results found, extracting all text...")
+            all_text = search_frame.locator('body').inner_text()
+            if "no results" not in all_text.lower() and len(all_text) > 100:
+                # Split by lines and look for data
+                lines = [l.strip() for l in all_text.split('\n') if l.strip()]
+                for line in lines:
+                    if len(line) > 20:  # Likely contains data
+                        results.append({
+                            "arrest_date": date_str,
+                            "raw_text": line,
+                            "scraped_at": datetime.now().isoformat()
+                        })
+        
+        print_success(f"Extracted {len(results)} records")
+        return results
+        
+    except Exception as e:
+        print_error(f"[{date_str}] ERROR: {str(e)}")
+        raise
+    finally:
+        page.close()
+
+def load_storage_state() -> Optional[Dict]:
+    """Browser state saved by the last run, or None if missing or unreadable"""
+    try:
+        with open(STORAGE_STATE_FILE, 'r') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        state = None
+    if isinstance(state, dict) and isinstance(state.get("cookies"), list) \
+            and isinstance(state.get("origins"), list):
+        return state
+    print_status(f"Ignoring unreadable {STORAGE_STATE_FILE}", "⚠️")
+    try:
+        os.remove(STORAGE_STATE_FILE)
+    except OSError:
+        pass
+    return None
+
+def save_storage_state(state: Dict):
+    """Atomically replace the saved browser state"""
+    tmp = STORAGE_STATE_FILE + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp, STORAGE_STATE_FILE)
+
+def scrape_dates(dates: List[str], headless: bool = True) -> List[Dict]:
+    """
+    Scrape several dates with a single browser launch and context
+    """
+    results = []
     with sync_playwright() as p:
         browser = p.chromium.launch(
             headless=headless,
@@ -50,121 +203,22 @@ def scrape_for_date(date_str: str, headless: bool = True) -> List[Dict]:
                 "--disable-dev-shm-usage",
             ]
         )
-        
-        # Create context with realistic settings
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-            timezone_id='America/New_York'
-        )
-        
-        page = context.new_page()
-        
         try:
-            # Navigate to main page
-            print_status("Loading main page...")
-            page.goto(ENTRY_URL, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(3000)  # Give page time to settle
-            
-            # Wait for iframe to appear
-            print_status("Waiting for search iframe...")
-            page.wait_for_selector('iframe', timeout=30000)
-            
-            # Get all iframes
-            iframes = page.frames
-            print_status(f"Found {len(iframes)} frames on page")
-            
-            # Find the iframe with the search interface
-            search_frame = None
-            for frame in iframes:
-                try:
-                    # Check if this frame has the search interface
-                    if frame.locator('input[placeholder*="date"]').count() > 0:
-                        search_frame = frame
-                        print_success("Found search interface iframe!")
-                        break
-                except:
-                    continue
-            
-            if not search_frame:
-                # Try alternate approach - look for iframe by src
-                print_status("Trying alternate iframe detection...")
-                iframe_element = page.query_selector('iframe')
-                if iframe_element:
-                    src = iframe_element.get_attribute('src')
-                    print_status(f"Iframe src: {src}")
-                    # Wait for iframe content to load
-                    page.wait_for_timeout(5000)
-                    search_frame = page.frame(iframe_element.get_attribute('name') or src)
-            
-            if not search_frame:
-                raise Exception("Could not find search interface iframe")
-            
-            # Now work within the iframe
-            print_status("Interacting with search form...")
-            
-            # Convert date format from YYYY-MM-DD to MM/DD/YYYY
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            formatted_date = date_obj.strftime("%m/%d/%Y")
-            
-            # Find and fill the date input
-            date_input = search_frame.locator('input[type="date"], input[placeholder*="date"]').first
-            date_input.fill(formatted_date)
-            print_status(f"Entered date: {formatted_date}")
-            
-            # Click search button
-            search_button = search_frame.locator('button:has-text("SEARCH"), input[type="submit"]').first
-            search_button.click()
-            print_status("Clicked search button")
-            
-            # Wait for results to load
-            print_status("Waiting for results...")
-            page.wait_for_timeout(5000)
-            
-            # Try to extract results from the iframe
-            results = []
-            
-            # Look for table rows
-            rows = search_frame.locator('table tr, .result-row, .inmate-row').all()
-            print_status(f"Found {len(rows)} potential result rows")
-            
-            for row in rows:
-                try:
-                    text = row.inner_text()
-                    if text and len(text) > 10:  # Skip empty or header rows
-                        # Extract data - this will need to be adjusted based on actual structure
-                        results.append({
-                            "arrest_date": date_str,
-                            "raw_text": text,
-                            "scraped_at": datetime.now().isoformat()
-                        })
-                except:
-                    continue
-            
-            # If no structured results, try to get all text content
-            if not results:
-                print_status("No structured results found, extracting all text...")
-                all_text = search_frame.locator('body').inner_text()
-                if "no results" not in all_text.lower() and len(all_text) > 100:
-                    # Split by lines and look for data
-                    lines = [l.strip() for l in all_text.split('\n') if l.strip()]
-                    for line in lines:
-                        if len(line) > 20:  # Likely contains data
-                            results.append({
-                                "arrest_date": date_str,
-                                "raw_text": line,
-                                "scraped_at": datetime.now().isoformat()
-                            })
-            
-            print_success(f"Extracted {len(results)} records")
-            return results
-            
-        except Exception as e:
-            print_error(f"[{date_str}] ERROR: {str(e)}")
-            raise
+            # Create context with realistic settings
+            context = browser.new_context(
+                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                viewport={'width': 1920, 'height': 1080},
+                locale='en-US',
+                timezone_id='America/New_York',
+                storage_state=load_storage_state(),
+            )
+            context.route("**/*", block_heavy_resources)
+            for d in dates:
+                results.extend(scrape_for_date(context, d))
+            save_storage_state(context.storage_state())
         finally:
             browser.close()
+    return results
 
 def upload_to_sheets(data: List[Dict], sheet_id: str, worksheet_name: str):
     """Upload data to Google Sheets"""
@@ -174,6 +228,10 @@ def upload_to_sheets(data: List[Dict], sheet_id: str, worksheet_name: str):
     
     print_status(f"Uploading {len(data)} records to Google Sheets...")
     
+    # Heavy imports, only needed when actually uploading
+    import pandas as pd
+    import gspread
+    
     try:
         gc = gspread.service_account(filename='credentials.json')
         sheet = gc.open_by_key(sheet_id)
@@ -187,15 +245,26 @@ def upload_to_sheets(data: List[Dict], sheet_id: str, worksheet_name: str):
         # Convert to DataFrame
         df = pd.DataFrame(data)
         
-        # Get existing data
-        existing = worksheet.get_all_records()
-        
-        if existing:
-            # Append to existing data
-            worksheet.append_rows(df.values.tolist())
+        # Only the header row is needed to tell an empty sheet from a filled one
+        header = worksheet.row_values(1)
+        rows = []
+        if not header:
+            header = df.columns.tolist()
+            rows.append(header)
         else:
-            # Write headers and data
-            worksheet.update([df.columns.values.tolist()] + df.values.tolist())
+            # Extend an older header (e.g. v1's) so no scraped column is dropped
+            missing = [c for c in df.columns if c not in header]
+            if missing:
+                header += missing
+                if len(header) > worksheet.col_count:
+                    worksheet.add_cols(len(header) - worksheet.col_count)
+                worksheet.update('A1', [header])
+                print_status(f"Added columns to sheet header: {', '.join(missing)}")
+        rows += df.reindex(columns=header).fillna("").values.tolist()
+        
+        # One append request for the whole run
+        worksheet.append_rows(rows, value_input_option='USER_ENTERED',
+                              insert_data_option='INSERT_ROWS')
         
         print_success(f"Successfully uploaded {len(data)} records to Google Sheets!")
         
@@ -224,7 +293,7 @@ def main():
     
     try:
         # Scrape data
-        results = scrape_for_date(args.date, headless=not args.headful)
+        results = scrape_dates([args.date], headless=not args.headful)
         
         print()
         print(f"📊 Total records scraped: {len(results)}")
@@ -2,122 +2,251 @@
 """
 Test script to verify the scraper setup is correct
 """
+import argparse
+import io
 import sys
 import os
+import time
+from functools import partial, wraps
+from importlib.metadata import PackageNotFoundError, distribution
 
-def test_imports():
+CREDENTIALS_FILE = 'credentials.json'
+GOOGLE_SHEET_ID = '14UfXJom1i9B9nfTiC0rzelDHM8mGJzw0pnoFxTyGpGo'
+WORKSHEET_NAME = 'Sarasota County'
+
+# Successful Sheets probes are reused for a few minutes across reruns
+GSHEETS_PROBE_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'sarasota_scraper', 'gsheets_probe.json')
+GSHEETS_PROBE_TTL = 300
+
+# Packages from requirements.txt as (import name, pip name)
+_PKGS = (
+    ("playwright", "playwright"),
+    ("pandas", "pandas"),
+    ("gspread", "gspread"),
+    ("tenacity", "tenacity"),
+    ("httpx", "httpx"),
+    ("lxml", "lxml"),
+    ("msgspec", "msgspec"),
+    ("orjson", "orjson"),
+)
+
+def _buffered(test):
+    """Collect a test's output lines and emit them with a single write"""
+    @wraps(test)
+    def run(*args, out=None, **kwargs):
+        lines = []
+        try:
+            return test(lines, *args, **kwargs)
+        finally:
+            (out or sys.stdout).write("\n".join(lines) + "\n")
+    return run
+
+@_buffered
+def test_imports(lines):
     """Test that all required packages are installed"""
-    print("Testing imports...")
-    try:
-        import playwright
-        print("  ✓ playwright installed")
-    except ImportError:
-        print("  ✗ playwright not installed - run: pip install -r requirements.txt")
-        return False
-    
-    try:
-        import pandas
-        print("  ✓ pandas installed")
-    except ImportError:
-        print("  ✗ pandas not installed - run: pip install -r requirements.txt")
-        return False
-    
-    try:
-        import gspread
-        print("  ✓ gspread installed")
-    except ImportError:
-        print("  ✗ gspread not installed - run: pip install -r requirements.txt")
-        return False
-    
-    try:
-        import tenacity
-        print("  ✓ tenacity installed")
-    except ImportError:
-        print("  ✗ tenacity not installed - run: pip install -r requirements.txt")
-        return False
+    lines.append("Testing imports...")
+    for mod, pip_name in _PKGS:
+        # Installed-distribution metadata only; the package itself is never loaded
+        try:
+            distribution(pip_name)
+            ok = True
+        except PackageNotFoundError:
+            ok = False
+        if not ok:
+            lines.append(f"  ✗ {mod} not installed - run: pip install {pip_name}")
+            return False
+        lines.append(f"  ✓ {mod} installed")
     
     return True
 
-def test_playwright_browser():
+@_buffered
+def test_playwright_browser(lines, deep=False):
     """Test that Playwright browsers are installed"""
-    print("\nTesting Playwright browser...")
+    lines.append("\nTesting Playwright browser...")
     try:
         from playwright.sync_api import sync_playwright
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            browser.close()
-        print("  ✓ Chromium browser installed and working")
+            # Checking the binary is enough unless a real launch was asked for
+            path = p.chromium.executable_path
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"No Chromium executable at {path}")
+            if deep:
+                browser = p.chromium.launch(headless=True)
+                browser.close()
+        if deep:
+            lines.append("  ✓ Chromium browser installed and working")
+        else:
+            lines.append("  ✓ Chromium browser installed")
         return True
     except Exception as e:
-        print(f"  ✗ Chromium browser not installed - run: python3 -m playwright install chromium")
-        print(f"    Error: {e}")
+        lines.append(f"  ✗ Chromium browser not installed - run: python3 -m playwright install chromium")
+        lines.append(f"    Error: {e}")
         return False
 
-def test_credentials():
+def _load_creds():
+    """Parse credentials.json: (parsed dict or None, read error or None)"""
+    # orjson parses straight from bytes; plain json keeps minimal installs working
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    try:
+        with open(CREDENTIALS_FILE, 'rb') as f:
+            return loads(f.read()), None
+    except Exception as e:
+        return None, e
+
+@_buffered
+def test_credentials(lines, creds_present, creds=None, creds_error=None):
     """Test that credentials file exists"""
-    print("\nTesting credentials...")
-    if os.path.exists('credentials.json'):
-        print("  ✓ credentials.json found")
-        try:
-            import json
-            with open('credentials.json', 'r') as f:
-                creds = json.load(f)
-            if 'client_email' in creds:
-                print(f"  ✓ Service account email: {creds['client_email']}")
-            else:
-                print("  ⚠ credentials.json missing 'client_email' field")
-            return True
-        except Exception as e:
-            print(f"  ✗ Error reading credentials.json: {e}")
+    lines.append("\nTesting credentials...")
+    if creds_present:
+        lines.append("  ✓ credentials.json found")
+        if creds is None:
+            lines.append(f"  ✗ Error reading credentials.json: {creds_error}")
             return False
+        if 'client_email' in creds:
+            lines.append(f"  ✓ Service account email: {creds['client_email']}")
+        else:
+            lines.append("  ⚠ credentials.json missing 'client_email' field")
+        return True
     else:
-        print("  ⚠ credentials.json not found")
-        print("    This is needed for Google Sheets upload")
-        print("    See SETUP.md for instructions")
+        lines.append("  ⚠ credentials.json not found")
+        lines.append("    This is needed for Google Sheets upload")
+        lines.append("    See SETUP.md for instructions")
         return False
 
-def test_google_sheets():
+def _read_probe_cache():
+    """Last successful Sheets probe if it is younger than the TTL, else None"""
+    try:
+        if os.path.getmtime(GSHEETS_PROBE_CACHE) < time.time() - GSHEETS_PROBE_TTL:
+            return None
+        import json
+        with open(GSHEETS_PROBE_CACHE, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Anything not shaped like what _write_probe_cache stores is a miss
+    if not isinstance(cached, dict) or not isinstance(cached.get('title'), str):
+        return None
+    if not {'sheet_id', 'client_email', 'worksheet'} <= cached.keys():
+        return None
+    if not isinstance(cached['worksheet'], (str, type(None))):
+        return None
+    return cached
+
+def _write_probe_cache(result):
+    """Atomically record a successful Sheets probe"""
+    import json
+    os.makedirs(os.path.dirname(GSHEETS_PROBE_CACHE), exist_ok=True)
+    tmp = GSHEETS_PROBE_CACHE + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(result, f)
+    os.replace(tmp, GSHEETS_PROBE_CACHE)
+
+@_buffered
+def test_google_sheets(lines, creds_present, creds=None, creds_error=None, force=False):
     """Test Google Sheets connection"""
-    print("\nTesting Google Sheets connection...")
-    if not os.path.exists('credentials.json'):
-        print("  ⚠ Skipping (no credentials.json)")
+    lines.append("\nTesting Google Sheets connection...")
+    if not creds_present:
+        lines.append("  ⚠ Skipping (no credentials.json)")
         return False
+    if creds is None:
+        lines.append(f"  ✗ Error reading credentials.json: {creds_error}")
+        return False
+    
+    # A recent success for the same sheet and service account skips the network
+    key = {'sheet_id': GOOGLE_SHEET_ID, 'client_email': creds.get('client_email')}
+    cached = None if force else _read_probe_cache()
+    if cached and all(cached.get(k) == v for k, v in key.items()):
+        lines.append(f"  ✓ Successfully connected to sheet: {cached['title']} (cached)")
+        if cached['worksheet']:
+            lines.append(f"  ✓ Found worksheet: {cached['worksheet']} (cached)")
+        else:
+            lines.append(f"  ⚠ Worksheet '{WORKSHEET_NAME}' not found (cached)")
+        return True
     
     try:
         import gspread
-        gc = gspread.service_account(filename='credentials.json')
-        sheet = gc.open_by_key('14UfXJom1i9B9nfTiC0rzelDHM8mGJzw0pnoFxTyGpGo')
-        print(f"  ✓ Successfully connected to sheet: {sheet.title}")
+        gc = gspread.service_account_from_dict(creds)
+        sheet = gc.open_by_key(GOOGLE_SHEET_ID)
+        lines.append(f"  ✓ Successfully connected to sheet: {sheet.title}")
         
+        wks_title = None
         try:
-            wks = sheet.worksheet('Sarasota County')
-            print(f"  ✓ Found worksheet: {wks.title}")
+            wks_title = sheet.worksheet(WORKSHEET_NAME).title
+            lines.append(f"  ✓ Found worksheet: {wks_title}")
         except:
-            print("  ⚠ Worksheet 'Sarasota County' not found (will be created on first run)")
-        
-        return True
+            lines.append(f"  ⚠ Worksheet '{WORKSHEET_NAME}' not found (will be created on first run)")
     except Exception as e:
-        print(f"  ✗ Error connecting to Google Sheets: {e}")
-        print("    Make sure the service account has access to the sheet")
+        lines.append(f"  ✗ Error connecting to Google Sheets: {e}")
+        lines.append("    Make sure the service account has access to the sheet")
         return False
+    
+    try:
+        _write_probe_cache({**key, 'title': sheet.title, 'worksheet': wks_title})
+    except OSError:
+        pass
+    return True
 
 def main():
+    ap = argparse.ArgumentParser(description="Verify the scraper setup")
+    ap.add_argument("--deep", action="store_true",
+                    help="Launch Chromium instead of only checking it is installed")
+    ap.add_argument("--force", action="store_true",
+                    help="Ignore the cached Google Sheets result and reconnect")
+    args = ap.parse_args()
+    
+    # concurrent.futures pulls in threading/queue machinery that --help and
+    # argument errors never need, so load it only once the checks run
+    from concurrent.futures import ThreadPoolExecutor
+    
     print("=" * 60)
     print("Sarasota County Scraper - Setup Test")
     print("=" * 60)
     
-    results = []
-    results.append(("Imports", test_imports()))
-    results.append(("Playwright Browser", test_playwright_browser()))
-    results.append(("Credentials", test_credentials()))
-    results.append(("Google Sheets", test_google_sheets()))
+    # Both credential checks depend on the file, so stat and parse it only
+    # once here rather than from two threads at the same time
+    creds_present = os.path.exists(CREDENTIALS_FILE)
+    creds, creds_error = _load_creds() if creds_present else (None, None)
+    if creds_present and creds_error is None and not isinstance(creds, dict):
+        creds, creds_error = None, ValueError("expected a JSON object")
+    creds_args = dict(creds_present=creds_present, creds=creds, creds_error=creds_error)
+    
+    # The package probe is cheap and gates the browser check, so run it first
+    results = [("Imports", test_imports())]
+    imports_ok = results[0][1]
+    
+    # (name, check, whether its prerequisites are met)
+    tests = [
+        ("Playwright Browser", partial(test_playwright_browser, deep=args.deep), imports_ok),
+        ("Credentials", partial(test_credentials, **creds_args), True),
+        ("Google Sheets", partial(test_google_sheets, force=args.force, **creds_args), creds_present),
+    ]
+    
+    # The remaining tests are independent and mostly wait on I/O, so run them
+    # together. Each writes to its own buffer, printed afterwards in order.
+    buffers = {name: io.StringIO() for name, _, _ in tests}
+    with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        futures = {name: pool.submit(fn, out=buffers[name]) for name, fn, ready in tests if ready}
+    
+    for name, _, _ in tests:
+        if name in futures:
+            sys.stdout.write(buffers[name].getvalue())
+            results.append((name, futures[name].result()))
+        else:
+            print(f"\nSkipping {name} check (prerequisite failed)")
+            results.append((name, None))
     
     print("\n" + "=" * 60)
     print("Test Results:")
     print("=" * 60)
     
     for name, passed in results:
-        status = "✓ PASS" if passed else "✗ FAIL"
+        if passed is None:
+            status = "- SKIP"
+        else:
+            status = "✓ PASS" if passed else "✗ FAIL"
         print(f"{name:.<40} {status}")
     
     all_passed = all(result[1] for result in results[:2])  # Only require imports and browser